@@ -21,6 +21,13 @@ from arxiv_to_ereader.fetcher import (
 from arxiv_to_ereader.parser import parse_paper
 from arxiv_to_ereader.screen_presets import SCREEN_PRESETS
 
+# Filename clean-up patterns, applied in order by sanitize_filename
+_UNSAFE_CHARS_RE = re.compile(r'[<>"|?*\x00-\x1f]')
+_WHITESPACE_RE = re.compile(r"[\s]+")
+_DASH_RUN_RE = re.compile(r"[-]+")
+_UNDERSCORE_RUN_RE = re.compile(r"[_]+")
+_MIXED_RUN_RE = re.compile(r"[-_]{2,}")
+
 
 def sanitize_filename(title: str, max_length: int = 80) -> str:
     """Convert a paper title to a safe filename.
@@ -34,11 +41,11 @@ def sanitize_filename(title: str, max_length: int = 80) -> str:
     """
     filename = title.replace(":", "-")
     filename = filename.replace("/", "-").replace("\\", "-")
-    filename = re.sub(r'[<>"|?*\x00-\x1f]', "", filename)
-    filename = re.sub(r"[\s]+", "_", filename)
-    filename = re.sub(r"[-]+", "-", filename)
-    filename = re.sub(r"[_]+", "_", filename)
-    filename = re.sub(r"[-_]{2,}", "_", filename)
+    filename = _UNSAFE_CHARS_RE.sub("", filename)
+    filename = _WHITESPACE_RE.sub("_", filename)
+    filename = _DASH_RUN_RE.sub("-", filename)
+    filename = _UNDERSCORE_RUN_RE.sub("_", filename)
+    filename = _MIXED_RUN_RE.sub("_", filename)
     filename = filename.strip("_-")
     if len(filename) > max_length:
         filename = filename[:max_length].rsplit("_", 1)[0].strip("_-")
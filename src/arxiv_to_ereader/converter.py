@@ -2,15 +2,28 @@
 
 import base64
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import httpx
-from playwright.sync_api import sync_playwright
 
 from arxiv_to_ereader.parser import Paper
 from arxiv_to_ereader.screen_presets import ScreenPreset, custom_preset, get_preset
 from arxiv_to_ereader.styles import get_pdf_stylesheet
 
+try:
+    # pybase64 (the "fast" extra) uses SIMD implementations, noticeably faster
+    # for large figures
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:
+
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+
+# Image downloads are I/O bound, so a handful of threads hides most of the latency
+MAX_IMAGE_DOWNLOAD_WORKERS = 8
+
 
 def _download_image(url: str, timeout: float = 30.0) -> tuple[bytes, str] | None:
     """Download an image and return its content and media type."""
@@ -28,6 +41,40 @@ def _download_image(url: str, timeout: float = 30.0) -> tuple[bytes, str] | None
         return None
 
 
+def _build_image_map(all_images: dict[str, str]) -> dict[str, str]:
+    """Download images and map both original and absolute URLs to data URIs.
+
+    Several original src values can resolve to the same absolute URL, so each
+    absolute URL is downloaded and encoded only once. Downloads run concurrently.
+
+    Args:
+        all_images: Map of original image src to absolute URL
+
+    Returns:
+        Map of original and absolute image URLs to base64 data URIs
+    """
+    urls = list(dict.fromkeys(all_images.values()))
+    workers = min(MAX_IMAGE_DOWNLOAD_WORKERS, len(urls)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_download_image, urls))
+
+    data_uris: dict[str, str | None] = {}
+    for absolute_url, result in zip(urls, results):
+        if result:
+            img_data, media_type = result
+            data_uris[absolute_url] = f"data:{media_type};base64,{_b64encode(img_data)}"
+        else:
+            data_uris[absolute_url] = None
+
+    image_map: dict[str, str] = {}
+    for original_src, absolute_url in all_images.items():
+        data_uri = data_uris[absolute_url]
+        if data_uri:
+            image_map[original_src] = data_uri
+            image_map[absolute_url] = data_uri
+    return image_map
+
+
 def _build_html_document(
     paper: Paper,
     image_map: dict[str, str],
@@ -141,6 +188,7 @@ def convert_to_pdf(
     custom_width_mm: float | None = None,
     custom_height_mm: float | None = None,
     download_images: bool = True,
+    output_dir: Path | str | None = None,
 ) -> Path:
     """Convert a parsed paper to PDF format optimized for e-readers.
 
@@ -155,6 +203,8 @@ def convert_to_pdf(
         custom_width_mm: Custom page width in mm (overrides preset)
         custom_height_mm: Custom page height in mm (overrides preset)
         download_images: Whether to download and embed images
+        output_dir: Directory for the default filename when output_path is
+            not given (defaults to the current directory)
 
     Returns:
         Path to the created PDF file
@@ -168,14 +218,7 @@ def convert_to_pdf(
     # Download images and create base64 data URI map
     image_map: dict[str, str] = {}
     if download_images and paper.all_images:
-        for original_src, absolute_url in paper.all_images.items():
-            result = _download_image(absolute_url)
-            if result:
-                img_data, media_type = result
-                b64_data = base64.b64encode(img_data).decode("ascii")
-                data_uri = f"data:{media_type};base64,{b64_data}"
-                image_map[original_src] = data_uri
-                image_map[absolute_url] = data_uri
+        image_map = _build_image_map(paper.all_images)
 
     # Build HTML document
     html_content = _build_html_document(paper, image_map, preset)
@@ -183,6 +226,8 @@ def convert_to_pdf(
     # Determine output path
     if output_path is None:
         output_path = Path(f"{paper.id.replace('/', '_')}.pdf")
+        if output_dir is not None:
+            output_path = Path(output_dir) / output_path
     else:
         output_path = Path(output_path)
         if output_path.suffix.lower() != ".pdf":
@@ -194,9 +239,14 @@ def convert_to_pdf(
     width_inches = preset.width_mm / 25.4
     height_inches = preset.height_mm / 25.4
 
+    # Imported here so that importing the package (e.g. for --version or just
+    # parsing) doesn't pay for loading Playwright
+    from playwright.sync_api import sync_playwright
+
     # Write HTML to temp file and render with Playwright
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-        f.write(html_content)
+    # Encode explicitly: the document declares UTF-8, whatever the locale says
+    with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as f:
+        f.write(html_content.encode("utf-8"))
         temp_html_path = f.name
 
     try:
@@ -210,9 +260,10 @@ def convert_to_pdf(
             # Wait for any async content to load
             page.wait_for_load_state("networkidle")
 
-            # Generate PDF with custom page size and document outline for navigation
-            page.pdf(
-                path=str(output_path),
+            # Generate PDF with custom page size and document outline for navigation.
+            # Keep the bytes in hand instead of passing path=, so callers that
+            # only need the data could skip the disk write later.
+            pdf_bytes = page.pdf(
                 width=f"{width_inches}in",
                 height=f"{height_inches}in",
                 margin={
@@ -227,6 +278,8 @@ def convert_to_pdf(
             )
 
             browser.close()
+
+        output_path.write_bytes(pdf_bytes)
     finally:
         # Clean up temp file
         Path(temp_html_path).unlink(missing_ok=True)
@@ -55,9 +55,47 @@ class Paper:
     all_images: dict[str, str] = field(default_factory=dict)
 
 
+# Extra classes added for styling, in the order they are appended, with the
+# LaTeXML classes that trigger them
+_STYLE_CLASSES: tuple[tuple[str, frozenset[str]], ...] = (
+    # Code blocks
+    ("code-block", frozenset({"ltx_listing", "ltx_verbatim"})),
+    # Theorems, proofs, definitions, lemmas
+    (
+        "theorem-like",
+        frozenset({
+            "ltx_theorem",
+            "ltx_proof",
+            "ltx_lemma",
+            "ltx_definition",
+            "ltx_corollary",
+            "ltx_proposition",
+            "ltx_remark",
+            "ltx_example",
+        }),
+    ),
+    # Display equations
+    ("math-block", frozenset({"ltx_equation", "ltx_equationgroup"})),
+    # Inline math
+    ("math-inline", frozenset({"ltx_Math"})),
+    # Citation references
+    ("citation", frozenset({"ltx_cite"})),
+)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _clean_text(text: str) -> str:
     """Clean up text by normalizing whitespace."""
-    return re.sub(r"\s+", " ", text).strip()
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _rewrite_ref_href(ref: Tag) -> None:
+    """Convert an absolute arXiv cross-reference URL to a relative anchor."""
+    href = ref.get("href", "")
+    if "arxiv.org/html/" in href and "#" in href:
+        ref["href"] = "#" + href.rpartition("#")[2]
 
 
 def _process_content(soup_fragment: Tag, footnote_counter: list[int]) -> tuple[str, list[Footnote]]:
@@ -79,13 +117,12 @@ def _process_content(soup_fragment: Tag, footnote_counter: list[int]) -> tuple[s
     """
     footnotes: list[Footnote] = []
 
-    # Helper to create new tags
+    # Helper to create new tags. A single empty document acts as the tag factory
+    # so we don't run the HTML parser once per created element.
+    tag_factory = BeautifulSoup("", "lxml")
+
     def new_tag(name: str, attrs: dict | None = None) -> Tag:
-        tag = BeautifulSoup(f"<{name}></{name}>", "lxml").find(name)
-        if attrs:
-            for k, v in attrs.items():
-                tag[k] = v
-        return tag
+        return tag_factory.new_tag(name, attrs=attrs or {})
 
     # 0. Convert algorithm SVGs to HTML blocks
     # LaTeXML renders algorithms as SVG with foreignobject, which has transform issues in PDF
@@ -105,25 +142,22 @@ def _process_content(soup_fragment: Tag, footnote_counter: list[int]) -> tuple[s
             continue
 
         # Extract title and body from foreignobjects
-        title_html = str(first_content)
         body_parts = []
         for fo in foreignobjects[1:]:
             content = fo.find(class_="ltx_foreignobject_content")
             if content:
-                body_parts.append(str(content))
+                body_parts.append(content)
 
-        # Create algorithm HTML block
+        # Create algorithm HTML block, moving the existing nodes instead of
+        # serializing and re-parsing them
         algo_div = new_tag("div", {"class": "algorithm-block"})
         title_div = new_tag("div", {"class": "algorithm-title"})
-        title_div.append(BeautifulSoup(title_html, "lxml").body.contents[0] if BeautifulSoup(title_html, "lxml").body else "")
+        title_div.append(first_content.extract())
         algo_div.append(title_div)
 
         body_div = new_tag("div", {"class": "algorithm-body"})
         for part in body_parts:
-            parsed = BeautifulSoup(part, "lxml")
-            if parsed.body:
-                for child in parsed.body.contents:
-                    body_div.append(child)
+            body_div.append(part.extract())
         algo_div.append(body_div)
 
         # Replace the figure containing the SVG with the algorithm block
@@ -167,9 +201,9 @@ def _process_content(soup_fragment: Tag, footnote_counter: list[int]) -> tuple[s
         # Get the note content (skip the note mark if present)
         note_content_elem = note.select_one(".ltx_note_content")
         if note_content_elem:
-            note_content = "".join(str(c) for c in note_content_elem.children)
+            note_content = note_content_elem.decode_contents()
         else:
-            note_content = "".join(str(c) for c in note.children)
+            note_content = note.decode_contents()
 
         footnotes.append(Footnote(id=note_id, index=idx, content=note_content.strip()))
 
@@ -186,59 +220,40 @@ def _process_content(soup_fragment: Tag, footnote_counter: list[int]) -> tuple[s
         link.append(sup)
         note.replace_with(link)
 
-    # 3. Handle Code Blocks: Ensure proper styling
-    for listing in soup_fragment.select(".ltx_listing, .ltx_verbatim"):
-        existing_classes = listing.get("class", [])
-        if "code-block" not in existing_classes:
-            listing["class"] = existing_classes + ["code-block"]
-
-    # 4. Handle Theorems, Proofs, Definitions, Lemmas
-    # LaTeXML uses ltx_theorem, ltx_proof, etc.
-    theorem_classes = [
-        "ltx_theorem",
-        "ltx_proof",
-        "ltx_lemma",
-        "ltx_definition",
-        "ltx_corollary",
-        "ltx_proposition",
-        "ltx_remark",
-        "ltx_example",
-    ]
-    for cls in theorem_classes:
-        for elem in soup_fragment.select(f".{cls}"):
-            # Add epub-friendly class
-            existing = elem.get("class", [])
-            if "theorem-like" not in existing:
-                elem["class"] = existing + ["theorem-like"]
-
-    # 5. Handle equations - ensure they have proper wrappers
-    for eq in soup_fragment.select(".ltx_equation, .ltx_equationgroup"):
-        existing = eq.get("class", [])
-        if "math-block" not in existing:
-            eq["class"] = existing + ["math-block"]
-
-    # 6. Handle inline math - add class for styling
-    for math in soup_fragment.select(".ltx_Math"):
-        existing = math.get("class", [])
-        if "math-inline" not in existing:
-            math["class"] = existing + ["math-inline"]
-
-    # 7. Handle cross-references - ensure they work in EPUB
-    for ref in soup_fragment.select(".ltx_ref"):
-        href = ref.get("href", "")
-        # Convert absolute arXiv URLs to relative anchors
-        if "arxiv.org/html/" in href and "#" in href:
-            ref["href"] = "#" + href.split("#")[-1]
-
-    # 8. Handle citation references
-    for cite in soup_fragment.select(".ltx_cite"):
-        existing = cite.get("class", [])
-        if "citation" not in existing:
-            cite["class"] = existing + ["citation"]
+    # 3-8. Add styling classes and fix cross-references in a single walk.
+    # Footnotes are already gone from the tree, so their content is untouched.
+    for elem in soup_fragment.find_all(class_=True):
+        classes = elem["class"]
+        if isinstance(classes, str):
+            classes = classes.split()
+        class_set = set(classes)
+
+        added = [
+            extra
+            for extra, sources in _STYLE_CLASSES
+            if extra not in class_set and not class_set.isdisjoint(sources)
+        ]
+        if added:
+            elem["class"] = list(classes) + added
+
+        if "ltx_ref" in class_set:
+            _rewrite_ref_href(elem)
 
     return str(soup_fragment), footnotes
 
 
+def _strip_math_annotations(soup: BeautifulSoup) -> None:
+    """Remove non-rendered MathML annotations in place.
+
+    LaTeXML wraps every formula in <semantics> with the TeX source and a
+    Content MathML copy as annotations. Browsers only render the first
+    (presentation) child, so the annotations just bloat the document that
+    Chromium has to parse and lay out. The TeX source stays in alttext.
+    """
+    for annotation in soup.find_all(["annotation", "annotation-xml"]):
+        annotation.decompose()
+
+
 def _extract_title(soup: BeautifulSoup) -> str:
     """Extract paper title."""
     # Try LaTeXML title class
@@ -262,6 +277,7 @@ def _extract_title(soup: BeautifulSoup) -> str:
 def _extract_authors(soup: BeautifulSoup) -> list[str]:
     """Extract author names."""
     authors = []
+    seen: set[str] = set()
 
     # Try LaTeXML author elements
     author_elems = soup.select(".ltx_personname")
@@ -293,7 +309,8 @@ def _extract_authors(soup: BeautifulSoup) -> list[str]:
                 else:
                     name = full_text
 
-            if name and name not in authors and len(name) < 100:
+            if name and name not in seen and len(name) < 100:
+                seen.add(name)
                 authors.append(name)
         return authors
 
@@ -341,6 +358,10 @@ def _extract_date(soup: BeautifulSoup) -> str | None:
     return None
 
 
+# LaTeXML section classes, each extracted as its own Section
+_SECTION_CLASSES = frozenset({"ltx_section", "ltx_subsection", "ltx_subsubsection"})
+
+
 def _extract_sections(soup: BeautifulSoup) -> tuple[list[Section], list[Footnote]]:
     """Extract paper sections with their content and footnotes."""
     sections = []
@@ -370,20 +391,16 @@ def _extract_sections(soup: BeautifulSoup) -> tuple[list[Section], list[Footnote
         # Create a container for content to process
         content_container = soup.new_tag("div")
 
-        for child in list(elem.children):
-            if isinstance(child, Tag):
-                child_classes = child.get("class", [])
-                # Skip the title element
-                if "ltx_title" in child_classes:
-                    continue
-                # Skip nested sections - they'll be processed separately
-                if any(
-                    cls in child_classes
-                    for cls in ["ltx_section", "ltx_subsection", "ltx_subsubsection"]
-                ):
-                    continue
-                # Clone the child to avoid modifying original
-                content_container.append(child)
+        for child in elem.find_all(True, recursive=False):
+            child_classes = child.get("class", [])
+            # Skip the title element
+            if "ltx_title" in child_classes:
+                continue
+            # Skip nested sections - they'll be processed separately
+            if not _SECTION_CLASSES.isdisjoint(child_classes):
+                continue
+            # Move the child into the container
+            content_container.append(child)
 
         # Process content (extract footnotes, wrap tables, etc.)
         processed_html, section_footnotes = _process_content(content_container, footnote_counter)
@@ -403,9 +420,8 @@ def _extract_sections(soup: BeautifulSoup) -> tuple[list[Section], list[Footnote
         main_content = soup.select_one(".ltx_page_main, .ltx_page_content, article, main, .content")
         if main_content:
             container = soup.new_tag("div")
-            for child in list(main_content.children):
-                if isinstance(child, Tag):
-                    container.append(child)
+            for child in main_content.find_all(True, recursive=False):
+                container.append(child)
 
             processed_html, section_footnotes = _process_content(container, footnote_counter)
             all_footnotes.extend(section_footnotes)
@@ -464,16 +480,12 @@ def _extract_all_images(soup: BeautifulSoup, base_url: str | None = None) -> dic
     """
     image_map = {}
 
-    # Find all img tags anywhere in the document
-    for img in soup.find_all("img"):
-        src = img.get("src", "")
+    # Find all img tags with a src anywhere in the document
+    for img in soup.find_all("img", src=True):
+        src = img["src"]
         if src and not src.startswith("data:"):  # Skip data URIs
-            if base_url:
-                absolute_url = urljoin(base_url, src)
-            else:
-                absolute_url = src
             # Map original src to absolute URL
-            image_map[src] = absolute_url
+            image_map[src] = urljoin(base_url, src) if base_url else src
 
     # Also find SVG images that might be linked
     for svg_use in soup.select("use[href], use[xlink\\:href]"):
@@ -493,11 +505,8 @@ def _extract_references(soup: BeautifulSoup) -> str | None:
     refs = soup.select_one(".ltx_bibliography, #references, .references")
     if refs:
         # Clean up the references for EPUB
-        # Convert absolute URLs to relative anchors
         for ref in refs.select(".ltx_ref"):
-            href = ref.get("href", "")
-            if "arxiv.org/html/" in href and "#" in href:
-                ref["href"] = "#" + href.split("#")[-1]
+            _rewrite_ref_href(ref)
         return str(refs)
     return None
 
@@ -523,6 +532,8 @@ def parse_paper(html: str, paper_id: str, base_url: str | None = None) -> Paper:
     figures = _extract_figures(soup, base_url)
     all_images = _extract_all_images(soup, base_url)
 
+    _strip_math_annotations(soup)
+
     # Now extract sections (this may modify the soup)
     sections, footnotes = _extract_sections(soup)
 
@@ -1,5 +1,8 @@
 """PDF styles for e-reader screens (browser-based rendering)."""
 
+import re
+from functools import lru_cache
+
 from arxiv_to_ereader.screen_presets import ScreenPreset
 
 
@@ -15,357 +18,387 @@ def get_pdf_stylesheet(preset: ScreenPreset) -> str:
     Returns:
         Complete CSS stylesheet
     """
-    return f"""
+    return _build_pdf_stylesheet(preset.base_font_pt)
+
+
+@lru_cache(maxsize=16)
+def _build_pdf_stylesheet(base_font_pt: float) -> str:
+    """Build the PDF stylesheet for a base font size.
+
+    The stylesheet only depends on the base font size, so it is cached per
+    size and shared by every preset (and custom page size) that uses it.
+    """
+    return f":root{{--base-font:{base_font_pt}pt}}{_PDF_CSS}"
+
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACE_RE = re.compile(r"\s*([{};:,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCTUATION_SPACE_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+# Font sizes are derived from the --base-font custom property, which is the
+# only per-preset value, so the rest of the stylesheet is a constant. The
+# source is kept readable here and minified once at import, which cuts the
+# stylesheet Chromium has to parse for every PDF roughly in half.
+_PDF_CSS_SOURCE = """
 /* Reset */
-* {{
+* {
     margin: 0;
     padding: 0;
     box-sizing: border-box;
-}}
+}
 
-body {{
+body {
     font-family: Georgia, "Times New Roman", serif;
-    font-size: {preset.base_font_pt}pt;
+    font-size: var(--base-font);
     line-height: 1.5;
     color: #000;
     background: #fff;
     text-align: justify;
     hyphens: auto;
     -webkit-hyphens: auto;
-}}
+}
 
 /* Headings */
-h1, h2, h3, h4, h5, h6 {{
+h1, h2, h3, h4, h5, h6 {
     font-family: Helvetica, Arial, sans-serif;
     font-weight: bold;
     line-height: 1.3;
     text-align: left;
     page-break-after: avoid;
-}}
+}
 
-h1 {{
-    font-size: {preset.base_font_pt * 1.5}pt;
+h1 {
+    font-size: calc(var(--base-font) * 1.5);
     margin: 0 0 12pt 0;
     page-break-before: always;
-}}
+}
 
-h1:first-of-type {{
+h1:first-of-type {
     page-break-before: avoid;
-}}
+}
 
-h2 {{
-    font-size: {preset.base_font_pt * 1.3}pt;
+h2 {
+    font-size: calc(var(--base-font) * 1.3);
     margin: 18pt 0 8pt 0;
-}}
+}
 
-h3 {{
-    font-size: {preset.base_font_pt * 1.1}pt;
+h3 {
+    font-size: calc(var(--base-font) * 1.1);
     margin: 14pt 0 6pt 0;
-}}
+}
 
-h4, h5, h6 {{
-    font-size: {preset.base_font_pt}pt;
+h4, h5, h6 {
+    font-size: var(--base-font);
     margin: 12pt 0 4pt 0;
-}}
+}
 
 /* Paragraphs */
-p {{
+p {
     margin-bottom: 8pt;
     text-indent: 0;
     orphans: 2;
     widows: 2;
-}}
+}
 
-p + p {{
+p + p {
     text-indent: 1.5em;
     margin-top: 0;
-}}
+}
 
 /* Links */
-a {{
+a {
     color: #0066cc;
     text-decoration: underline;
-}}
+}
 
 /* Images */
-img {{
+img {
     max-width: 100%;
     height: auto;
     display: block;
     margin: 12pt auto;
-}}
+}
 
-figure {{
+figure {
     margin: 16pt 0;
     text-align: center;
     page-break-inside: avoid;
-}}
+}
 
-figcaption, .ltx_caption {{
-    font-size: {preset.base_font_pt * 0.9}pt;
+figcaption, .ltx_caption {
+    font-size: calc(var(--base-font) * 0.9);
     font-style: italic;
     margin-top: 6pt;
     text-align: center;
-}}
+}
 
 /* Tables */
-table {{
+table {
     width: 100%;
     border-collapse: collapse;
     margin: 12pt 0;
-    font-size: {preset.base_font_pt * 0.9}pt;
+    font-size: calc(var(--base-font) * 0.9);
     page-break-inside: avoid;
-}}
+}
 
-th, td {{
+th, td {
     border: 0.5pt solid #666;
     padding: 4pt 6pt;
     text-align: left;
-}}
+}
 
-th {{
+th {
     background: #f0f0f0;
     font-weight: bold;
-}}
+}
 
 /* Code */
-pre, code {{
+pre, code {
     font-family: "Courier New", Courier, monospace;
-    font-size: {preset.base_font_pt * 0.85}pt;
+    font-size: calc(var(--base-font) * 0.85);
     background: #f5f5f5;
-}}
+}
 
-pre {{
+pre {
     padding: 8pt;
     white-space: pre-wrap;
     word-wrap: break-word;
     page-break-inside: avoid;
-}}
+}
 
-code {{
+code {
     padding: 1pt 3pt;
-}}
+}
 
 /* Lists */
-ul, ol {{
+ul, ol {
     margin: 8pt 0;
     padding-left: 1.5em;
-}}
+}
 
-li {{
+li {
     margin-bottom: 4pt;
-}}
+}
 
 /* Cover page */
-.cover {{
+.cover {
     text-align: center;
     padding: 20pt 10pt;
     page-break-after: always;
-}}
+}
 
-.cover h1 {{
+.cover h1 {
     page-break-before: avoid;
     margin-bottom: 16pt;
-    font-size: {preset.base_font_pt * 1.6}pt;
-}}
+    font-size: calc(var(--base-font) * 1.6);
+}
 
-.cover .authors {{
-    font-size: {preset.base_font_pt * 1.1}pt;
+.cover .authors {
+    font-size: calc(var(--base-font) * 1.1);
     font-style: italic;
     margin-bottom: 24pt;
-}}
+}
 
-.cover .paper-id {{
-    font-size: {preset.base_font_pt * 0.9}pt;
+.cover .paper-id {
+    font-size: calc(var(--base-font) * 0.9);
     color: #666;
-}}
+}
 
-.cover .date {{
-    font-size: {preset.base_font_pt * 0.9}pt;
+.cover .date {
+    font-size: calc(var(--base-font) * 0.9);
     color: #666;
     margin-top: 8pt;
-}}
+}
 
 /* Abstract */
-.abstract {{
+.abstract {
     margin: 16pt 0;
     padding: 12pt;
     background: #f8f8f8;
     border-left: 3pt solid #666;
-}}
+}
 
-.abstract-title {{
+.abstract-title {
     font-weight: bold;
     margin-bottom: 8pt;
-}}
+}
 
 /* Theorem-like environments */
 .theorem-like, .ltx_theorem, .ltx_lemma, .ltx_definition,
-.ltx_corollary, .ltx_proposition, .ltx_remark, .ltx_example {{
+.ltx_corollary, .ltx_proposition, .ltx_remark, .ltx_example {
     margin: 14pt 0;
     padding: 10pt;
     background: #f9f9f9;
     border: 0.5pt solid #ddd;
     border-left: 3pt solid #666;
     page-break-inside: avoid;
-}}
+}
 
-.ltx_proof {{
+.ltx_proof {
     margin: 10pt 0;
     padding: 8pt 10pt;
     border-left: 2pt solid #999;
-}}
+}
 
 /* MathML - native browser rendering */
-math {{
+math {
     font-size: 1em;
-}}
+}
 
-math[display="block"] {{
+math[display="block"] {
     display: block;
     text-align: center;
     margin: 12pt 0;
-}}
+}
 
 /* Equation tables */
-table.ltx_equation, table.ltx_eqn_table {{
+table.ltx_equation, table.ltx_eqn_table {
     border: none;
     margin: 12pt 0;
     width: 100%;
-}}
+}
 
 table.ltx_equation td,
-table.ltx_eqn_table td {{
+table.ltx_eqn_table td {
     border: none;
     padding: 4pt 0;
     vertical-align: middle;
-}}
+}
 
-.ltx_eqn_cell {{
+.ltx_eqn_cell {
     text-align: center;
-}}
+}
 
-.ltx_eqn_eqno {{
+.ltx_eqn_eqno {
     text-align: right;
-    font-size: {preset.base_font_pt * 0.9}pt;
+    font-size: calc(var(--base-font) * 0.9);
     color: #444;
     width: 10%;
-}}
+}
 
 /* Citations */
-.citation, .ltx_cite {{
+.citation, .ltx_cite {
     font-style: normal;
-}}
+}
 
 /* References */
-.ltx_bibliography, .references {{
+.ltx_bibliography, .references {
     margin-top: 20pt;
-}}
+}
 
-.ltx_bibitem {{
+.ltx_bibitem {
     margin-bottom: 8pt;
     padding-left: 2em;
     text-indent: -2em;
-    font-size: {preset.base_font_pt * 0.9}pt;
-}}
+    font-size: calc(var(--base-font) * 0.9);
+}
 
 /* Footnotes section */
-.footnotes-section {{
+.footnotes-section {
     margin-top: 20pt;
     padding-top: 10pt;
     border-top: 0.5pt solid #ccc;
-    font-size: {preset.base_font_pt * 0.9}pt;
-}}
+    font-size: calc(var(--base-font) * 0.9);
+}
 
-.footnotes-section h2 {{
-    font-size: {preset.base_font_pt * 1.1}pt;
+.footnotes-section h2 {
+    font-size: calc(var(--base-font) * 1.1);
     margin-bottom: 10pt;
-}}
+}
 
 /* Footnote references */
-.footnote-ref {{
+.footnote-ref {
     text-decoration: none;
     color: #0066cc;
-}}
+}
 
-.footnote-ref sup {{
+.footnote-ref sup {
     font-size: 0.75em;
-}}
+}
 
 /* LaTeXML specific */
-.ltx_para {{
+.ltx_para {
     margin-bottom: 8pt;
-}}
+}
 
-.ltx_item {{
+.ltx_item {
     margin-bottom: 4pt;
-}}
+}
 
 /* Code blocks */
-.code-block, .ltx_listing, .ltx_verbatim {{
+.code-block, .ltx_listing, .ltx_verbatim {
     background: #f5f5f5;
     padding: 8pt;
     margin: 10pt 0;
     font-family: "Courier New", Courier, monospace;
-    font-size: {preset.base_font_pt * 0.85}pt;
+    font-size: calc(var(--base-font) * 0.85);
     white-space: pre-wrap;
     word-wrap: break-word;
     border: 0.5pt solid #ddd;
-}}
+}
 
 /* Blockquotes */
-blockquote {{
+blockquote {
     margin: 10pt 15pt;
     padding-left: 10pt;
     border-left: 2pt solid #ccc;
     font-style: italic;
-}}
+}
 
 /* Section breaks */
-.ltx_section {{
+.ltx_section {
     page-break-before: auto;
-}}
+}
 
 /* Table wrapper */
-.table-wrapper {{
+.table-wrapper {
     margin: 12pt 0;
-}}
+}
 
 /* LaTeXML span-based tables */
-.ltx_tabular {{
+.ltx_tabular {
     display: table;
     border-collapse: collapse;
     margin: 8pt auto;
-    font-size: {preset.base_font_pt * 0.85}pt;
-}}
+    font-size: calc(var(--base-font) * 0.85);
+}
 
-.ltx_tr {{
+.ltx_tr {
     display: table-row;
-}}
+}
 
-.ltx_td, .ltx_th {{
+.ltx_td, .ltx_th {
     display: table-cell;
     padding: 3pt 5pt;
     text-align: left;
     vertical-align: middle;
-}}
+}
 
 /* LaTeXML table borders */
-.ltx_border_t {{ border-top: 0.5pt solid #444; }}
-.ltx_border_b {{ border-bottom: 0.5pt solid #444; }}
-.ltx_border_l {{ border-left: 0.5pt solid #444; }}
-.ltx_border_r {{ border-right: 0.5pt solid #444; }}
-.ltx_border_tt {{ border-top: 1pt solid #000; }}
-.ltx_border_bb {{ border-bottom: 1pt solid #000; }}
+.ltx_border_t { border-top: 0.5pt solid #444; }
+.ltx_border_b { border-bottom: 0.5pt solid #444; }
+.ltx_border_l { border-left: 0.5pt solid #444; }
+.ltx_border_r { border-right: 0.5pt solid #444; }
+.ltx_border_tt { border-top: 1pt solid #000; }
+.ltx_border_bb { border-bottom: 1pt solid #000; }
 
 /* LaTeXML table figure */
-.ltx_table {{
+.ltx_table {
     margin: 12pt auto;
     page-break-inside: avoid;
-}}
+}
 
 /* Transform containers - reset transforms for e-reader readability */
-.ltx_transformed_outer {{
+.ltx_transformed_outer {
     display: block;
     margin: 8pt auto;
     max-width: 100%;
@@ -374,87 +407,77 @@ blockquote {{
     width: auto !important;
     height: auto !important;
     vertical-align: baseline !important;
-}}
+}
 
-.ltx_transformed_inner {{
+.ltx_transformed_inner {
     display: block;
     /* Reset scaling transforms - we want full-size content on e-readers */
     transform: none !important;
-}}
+}
 
 /* Tables should be allowed to overflow with scrolling if needed */
-.ltx_table .ltx_transformed_outer {{
+.ltx_table .ltx_transformed_outer {
     overflow-x: auto;
-}}
+}
 
 /* SVG figures (algorithms, diagrams) */
-svg.ltx_picture {{
+svg.ltx_picture {
     max-width: 100%;
     height: auto;
     display: block;
     margin: 10pt auto;
-}}
+}
 
 /* Foreign objects in SVG need proper sizing */
-svg foreignobject {{
+svg foreignobject {
     overflow: visible;
-}}
+}
 
-.ltx_foreignobject_container {{
+.ltx_foreignobject_container {
     display: block;
-}}
+}
 
 /* Algorithm boxes - converted from SVG to HTML */
-.algorithm-block {{
+.algorithm-block {
     margin: 14pt 0;
     padding: 10pt;
     background: #f5f5f5;
     border: 1pt solid #999;
     border-radius: 4pt;
     page-break-inside: avoid;
-}}
+}
 
-.algorithm-title {{
+.algorithm-title {
     font-weight: bold;
-    font-size: {preset.base_font_pt * 1.05}pt;
+    font-size: calc(var(--base-font) * 1.05);
     margin-bottom: 8pt;
     padding-bottom: 6pt;
     border-bottom: 0.5pt solid #ccc;
-}}
+}
 
-.algorithm-body {{
-    font-size: {preset.base_font_pt * 0.95}pt;
+.algorithm-body {
+    font-size: calc(var(--base-font) * 0.95);
     line-height: 1.6;
-}}
+}
 
-.algorithm-body .ltx_p {{
+.algorithm-body .ltx_p {
     margin: 4pt 0;
     text-indent: 0;
-}}
+}
 
 /* Fallback for SVG algorithms that weren't converted */
-.ltx_figure svg {{
+.ltx_figure svg {
     max-width: 100%;
     height: auto;
-}}
+}
 
-/* Print-specific */
-@media print {{
-    body {{
+/* Print-specific (page-break rules above already apply when printing) */
+@media print {
+    body {
         -webkit-print-color-adjust: exact;
         print-color-adjust: exact;
-    }}
-
-    .cover {{
-        page-break-after: always;
-    }}
-
-    h1, h2, h3, h4, h5, h6 {{
-        page-break-after: avoid;
-    }}
-
-    figure, table, pre {{
-        page-break-inside: avoid;
-    }}
-}}
+    }
+}
 """
+
+_PDF_CSS = _minify_css(_PDF_CSS_SOURCE)
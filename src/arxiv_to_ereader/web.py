@@ -1,9 +1,11 @@
 """Streamlit web interface for arxiv-ereader."""
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from arxiv_to_ereader.converter import convert_to_pdf
 from arxiv_to_ereader.fetcher import (
@@ -12,7 +14,7 @@ from arxiv_to_ereader.fetcher import (
     fetch_paper,
     normalize_arxiv_id,
 )
-from arxiv_to_ereader.parser import parse_paper
+from arxiv_to_ereader.parser import Paper, parse_paper
 from arxiv_to_ereader.screen_presets import SCREEN_PRESETS
 
 st.set_page_config(
@@ -71,70 +73,91 @@ with col2:
         help="Download and embed images (unchecked = faster, smaller files)",
     )
 
-# Convert button
-if st.button("Convert to PDF", type="primary", disabled=not paper_inputs):
-    results = []
+# Papers converted at once; each conversion runs its own headless Chromium
+MAX_CONVERSION_WORKERS = 4
 
-    progress_bar = st.progress(0)
-    status_text = st.empty()
 
-    for i, paper_input in enumerate(paper_inputs):
-        progress = (i + 1) / len(paper_inputs)
-        progress_bar.progress(progress)
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _load_paper(paper_id: str) -> Paper:
+    """Fetch and parse a paper, cached so re-converting with other options is fast."""
+    _, html = fetch_paper(paper_id)
+    return parse_paper(html, paper_id)
 
-        try:
-            # Normalize ID
-            status_text.text(f"Processing {paper_input}...")
-            paper_id = normalize_arxiv_id(paper_input)
 
-            # Fetch HTML
-            status_text.text(f"Fetching {paper_id}...")
-            _, html = fetch_paper(paper_id)
+def _convert_paper(paper_input: str, screen_preset: str, download_images: bool) -> dict:
+    """Fetch, parse and convert one paper, returning a result dict.
 
-            # Parse HTML
-            status_text.text(f"Parsing {paper_id}...")
-            paper = parse_paper(html, paper_id)
-
-            # Convert to PDF
-            status_text.text(f"Converting {paper_id} to PDF...")
+    Runs in a worker thread, so it must not create any UI elements. The
+    cached _load_paper call relies on the script-run context that the
+    executor's initializer propagates to each worker thread.
+    """
+    try:
+        paper_id = normalize_arxiv_id(paper_input)
+        paper = _load_paper(paper_id)
 
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-                output_path = Path(tmp.name)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            output_path = Path(tmp.name)
 
+        try:
             pdf_path = convert_to_pdf(
                 paper,
                 output_path=output_path,
                 screen_preset=screen_preset,
                 download_images=download_images,
             )
+        except Exception:
+            output_path.unlink(missing_ok=True)
+            raise
+
+        return {
+            "success": True,
+            "paper_id": paper_id,
+            "title": paper.title,
+            "authors": paper.authors,
+            "path": pdf_path,
+        }
+
+    except (ArxivHTMLNotAvailable, ArxivFetchError, ValueError) as e:
+        return {
+            "success": False,
+            "paper_id": paper_input,
+            "error": str(e),
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "paper_id": paper_input,
+            "error": f"Unexpected error: {e}",
+        }
 
-            results.append(
-                {
-                    "success": True,
-                    "paper_id": paper_id,
-                    "title": paper.title,
-                    "authors": paper.authors,
-                    "path": pdf_path,
-                }
-            )
 
-        except (ArxivHTMLNotAvailable, ArxivFetchError, ValueError) as e:
-            results.append(
-                {
-                    "success": False,
-                    "paper_id": paper_input,
-                    "error": str(e),
-                }
-            )
+# Convert button
+if st.button("Convert to PDF", type="primary", disabled=not paper_inputs):
+    results: list[dict] = [{}] * len(paper_inputs)
 
-        except Exception as e:
-            results.append(
-                {
-                    "success": False,
-                    "paper_id": paper_input,
-                    "error": f"Unexpected error: {e}",
-                }
-            )
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    status_text.text(f"Converting {len(paper_inputs)} paper(s)...")
+
+    # Papers are independent and mostly wait on the network or the browser,
+    # so convert them concurrently. Streamlit is only touched from this thread;
+    # workers just share this run's context so the cached _load_paper works.
+    workers = min(MAX_CONVERSION_WORKERS, len(paper_inputs))
+    script_ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        initializer=lambda: add_script_run_ctx(ctx=script_ctx),
+    ) as executor:
+        futures = {
+            executor.submit(_convert_paper, paper_input, screen_preset, download_images): i
+            for i, paper_input in enumerate(paper_inputs)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            results[i] = future.result()
+            progress_bar.progress(done / len(paper_inputs))
+            status_text.text(f"Finished {results[i]['paper_id']} ({done}/{len(paper_inputs)})")
 
     progress_bar.empty()
     status_text.empty()
@@ -146,16 +169,19 @@ if st.button("Convert to PDF", type="primary", disabled=not paper_inputs):
         if result["success"]:
             st.success(f"✅ {result['paper_id']}: {result['title']}")
 
-            # Read file and provide download
-            with open(result["path"], "rb") as f:
-                pdf_data = f.read()
-
-            st.download_button(
-                label=f"📥 Download {result['paper_id']}.pdf",
-                data=pdf_data,
-                file_name=f"{result['paper_id'].replace('/', '_')}.pdf",
-                mime="application/pdf",
-            )
+            # Hand the file to Streamlit directly rather than reading it into a
+            # separate bytes object first
+            with open(result["path"], "rb") as pdf_file:
+                st.download_button(
+                    label=f"📥 Download {result['paper_id']}.pdf",
+                    data=pdf_file,
+                    file_name=f"{result['paper_id'].replace('/', '_')}.pdf",
+                    mime="application/pdf",
+                )
+
+            # Streamlit now holds its own copy of the PDF, so don't leave the
+            # temp file behind in /tmp
+            result["path"].unlink(missing_ok=True)
 
             with st.expander("Paper details"):
                 st.write(f"**Authors:** {', '.join(result['authors'])}")
@@ -2,6 +2,30 @@
 
 import pytest
 
+from arxiv_to_ereader.converter import convert_to_pdf
+from arxiv_to_ereader.parser import Paper
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the opt-in flag for network-backed tests."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked 'integration' (require network access)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip integration tests unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
 # Sample arXiv HTML content (simplified LaTeXML output structure)
 SAMPLE_ARXIV_HTML = """
 <!DOCTYPE html>
@@ -95,3 +119,21 @@ MINIMAL_HTML = """
 def minimal_html() -> str:
     """Return minimal HTML content for edge case testing."""
     return MINIMAL_HTML
+
+
+@pytest.fixture(scope="session")
+def reference_pdf_bytes(tmp_path_factory: pytest.TempPathFactory) -> bytes:
+    """Convert a minimal paper with the default preset once per session.
+
+    Structural checks (header, EOF marker, parseability) share these bytes
+    instead of each launching Chromium for their own copy.
+    """
+    paper = Paper(
+        id="test.00001",
+        title="Test Paper Title",
+        authors=["Author"],
+        abstract="Abstract",
+        sections=[],
+    )
+    output_path = tmp_path_factory.mktemp("reference") / "test.pdf"
+    return convert_to_pdf(paper, output_path, download_images=False).read_bytes()
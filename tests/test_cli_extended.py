@@ -1,8 +1,9 @@
 """Extended CLI tests with mocked HTTP."""
 
-import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 import respx
 from httpx import Response
 from typer.testing import CliRunner
@@ -31,136 +32,115 @@ SAMPLE_HTML = """
 </html>
 """
 
+# Encoded once so the mocked responses don't re-encode the same payload
+SAMPLE_HTML_BYTES = SAMPLE_HTML.encode("utf-8")
+HTML_HEADERS = {"content-type": "text/html; charset=utf-8"}
 
+
+@pytest.fixture
+def mock_arxiv() -> Iterator[respx.MockRouter]:
+    """Serve SAMPLE_HTML for the known paper IDs and a 404 for 0000.00000."""
+    with respx.mock(assert_all_called=False) as router:
+        for paper_id in ("2402.08954", "1234.56789"):
+            router.get(f"https://arxiv.org/html/{paper_id}").mock(
+                return_value=Response(200, content=SAMPLE_HTML_BYTES, headers=HTML_HEADERS)
+            )
+        router.get("https://arxiv.org/html/0000.00000").mock(return_value=Response(404))
+        yield router
+
+
+@pytest.mark.usefixtures("mock_arxiv")
 class TestCLIConversion:
     """Tests for actual CLI conversion with mocked HTTP."""
 
-    @respx.mock
-    def test_convert_single_paper_success(self) -> None:
+    def test_convert_single_paper_success(self, tmp_path: Path) -> None:
         """Test converting a single paper via CLI."""
         paper_id = "2402.08954"
-        respx.get(f"https://arxiv.org/html/{paper_id}").mock(
-            return_value=Response(200, text=SAMPLE_HTML)
-        )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = runner.invoke(
-                app, [paper_id, "-o", tmpdir, "--no-images"]
-            )
+        result = runner.invoke(
+            app, [paper_id, "-o", str(tmp_path), "--no-images"]
+        )
 
-            assert result.exit_code == 0
-            assert "Success" in result.stdout
-            assert "Test Paper Title" in result.stdout
+        assert result.exit_code == 0
+        assert "Success" in result.stdout
+        assert "Test Paper Title" in result.stdout
 
-            # Check file was created
-            pdf_files = list(Path(tmpdir).glob("*.pdf"))
-            assert len(pdf_files) == 1
+        # Check file was created
+        pdf_files = list(tmp_path.glob("*.pdf"))
+        assert len(pdf_files) == 1
 
-    @respx.mock
     def test_convert_single_paper_not_found(self) -> None:
         """Test CLI handles 404 gracefully."""
         paper_id = "0000.00000"
-        respx.get(f"https://arxiv.org/html/{paper_id}").mock(
-            return_value=Response(404)
-        )
 
         result = runner.invoke(app, [paper_id])
 
         assert result.exit_code == 1
         assert "not available" in result.stdout.lower()
 
-    @respx.mock
-    def test_convert_with_screen_preset(self) -> None:
+    @pytest.mark.parametrize("screen", ["kindle-paperwhite", "kindle-scribe", "remarkable"])
+    def test_convert_with_screen_preset(self, tmp_path: Path, screen: str) -> None:
         """Test converting with different screen presets."""
         paper_id = "2402.08954"
-        respx.get(f"https://arxiv.org/html/{paper_id}").mock(
-            return_value=Response(200, text=SAMPLE_HTML)
+
+        result = runner.invoke(
+            app,
+            [paper_id, "-o", str(tmp_path), "--screen", screen, "--no-images"],
         )
+        assert result.exit_code == 0
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            for screen in ["kindle-paperwhite", "kindle-scribe", "remarkable"]:
-                result = runner.invoke(
-                    app,
-                    [paper_id, "-o", tmpdir, "--screen", screen, "--no-images"],
-                )
-                # Each should succeed (may overwrite same file)
-                assert result.exit_code == 0
-
-    @respx.mock
-    def test_convert_from_url(self) -> None:
+    def test_convert_from_url(self, tmp_path: Path) -> None:
         """Test converting from arXiv URL."""
         paper_id = "2402.08954"
         url = f"https://arxiv.org/abs/{paper_id}"
-        respx.get(f"https://arxiv.org/html/{paper_id}").mock(
-            return_value=Response(200, text=SAMPLE_HTML)
-        )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = runner.invoke(app, [url, "-o", tmpdir, "--no-images"])
+        # --use-id names the file from the ID the CLI normalizes out of the URL
+        result = runner.invoke(app, [url, "-o", str(tmp_path), "--no-images", "--use-id"])
 
-            assert result.exit_code == 0
-            assert "Success" in result.stdout
+        assert result.exit_code == 0
+        assert "Success" in result.stdout
+        assert (tmp_path / f"{paper_id}.pdf").exists()
 
-    @respx.mock
-    def test_convert_with_custom_dimensions(self) -> None:
+    def test_convert_with_custom_dimensions(self, tmp_path: Path) -> None:
         """Test converting with custom page dimensions."""
         paper_id = "2402.08954"
-        respx.get(f"https://arxiv.org/html/{paper_id}").mock(
-            return_value=Response(200, text=SAMPLE_HTML)
-        )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = runner.invoke(
-                app,
-                [paper_id, "-o", tmpdir, "--width", "150", "--height", "200", "--no-images"],
-            )
+        result = runner.invoke(
+            app,
+            [paper_id, "-o", str(tmp_path), "--width", "150", "--height", "200", "--no-images"],
+        )
 
-            assert result.exit_code == 0
-            assert "Success" in result.stdout
+        assert result.exit_code == 0
+        assert "Success" in result.stdout
 
 
+@pytest.mark.usefixtures("mock_arxiv")
 class TestCLIBatchConversion:
     """Tests for batch conversion via CLI."""
 
-    @respx.mock
-    def test_batch_convert_multiple_papers(self) -> None:
+    def test_batch_convert_multiple_papers(self, tmp_path: Path) -> None:
         """Test converting multiple papers via CLI."""
         papers = ["2402.08954", "1234.56789"]
 
-        for paper_id in papers:
-            respx.get(f"https://arxiv.org/html/{paper_id}").mock(
-                return_value=Response(200, text=SAMPLE_HTML)
-            )
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Use --use-id to ensure unique filenames since sample HTML has same title
-            result = runner.invoke(
-                app, [*papers, "-o", tmpdir, "--no-images", "--use-id"]
-            )
+        # Use --use-id to ensure unique filenames since sample HTML has same title
+        result = runner.invoke(
+            app, [*papers, "-o", str(tmp_path), "--no-images", "--use-id"]
+        )
 
-            assert result.exit_code == 0
-            assert "2 succeeded" in result.stdout
+        assert result.exit_code == 0
+        assert "2 succeeded" in result.stdout
 
-            # Check files were created with arXiv IDs
-            pdf_files = list(Path(tmpdir).glob("*.pdf"))
-            assert len(pdf_files) == 2
+        # Check files were created with arXiv IDs
+        pdf_files = list(tmp_path.glob("*.pdf"))
+        assert len(pdf_files) == 2
 
-    @respx.mock
-    def test_batch_convert_partial_failure(self) -> None:
+    def test_batch_convert_partial_failure(self, tmp_path: Path) -> None:
         """Test batch conversion with some failures."""
-        respx.get("https://arxiv.org/html/2402.08954").mock(
-            return_value=Response(200, text=SAMPLE_HTML)
-        )
-        respx.get("https://arxiv.org/html/0000.00000").mock(
-            return_value=Response(404)
+        result = runner.invoke(
+            app,
+            ["2402.08954", "0000.00000", "-o", str(tmp_path), "--no-images"],
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = runner.invoke(
-                app,
-                ["2402.08954", "0000.00000", "-o", tmpdir, "--no-images"],
-            )
-
-            assert result.exit_code == 0
-            assert "1 succeeded" in result.stdout
-            assert "1 failed" in result.stdout
+        assert result.exit_code == 0
+        assert "1 succeeded" in result.stdout
+        assert "1 failed" in result.stdout
@@ -1,100 +1,154 @@
 """Extended converter tests."""
 
-import tempfile
+import base64
+import dataclasses
 from pathlib import Path
 
+import httpx
 import pytest
 import respx
 from httpx import Response
 
+from arxiv_to_ereader import converter
 from arxiv_to_ereader.converter import (
+    _build_image_map,
     _download_image,
     convert_to_pdf,
 )
 from arxiv_to_ereader.parser import Figure, Footnote, Paper, Section
 
+_PNG_BYTES = b"\x89PNG\r\n\x1a\n fake png data"
+_JPEG_BYTES = b"\xff\xd8\xff fake jpeg"
+_FIGURE_URL = "https://arxiv.org/html/1234.56789/figure1.png"
+
+
+@pytest.fixture
+def image_registry(monkeypatch: pytest.MonkeyPatch) -> dict[str, tuple[bytes, str]]:
+    """Replace _download_image with a lookup in a dict the test fills in.
+
+    The downloader has its own tests; this lets converter tests control which
+    images "download" without going through httpx. Unregistered URLs fail.
+    """
+    registry: dict[str, tuple[bytes, str]] = {}
+    monkeypatch.setattr(
+        converter, "_download_image", lambda url, timeout=30.0: registry.get(url)
+    )
+    return registry
+
 
 class TestImageDownload:
     """Tests for image download functionality."""
 
     @respx.mock
-    def test_download_image_success(self) -> None:
-        """Test successful image download."""
-        image_url = "https://arxiv.org/html/1234.56789/figure1.png"
-        image_content = b"\x89PNG\r\n\x1a\n fake png data"
+    @pytest.mark.parametrize(
+        ("image_url", "mock", "expected"),
+        [
+            pytest.param(
+                _FIGURE_URL,
+                {
+                    "return_value": Response(
+                        200, content=_PNG_BYTES, headers={"content-type": "image/png"}
+                    )
+                },
+                (_PNG_BYTES, "image/png"),
+                id="png",
+            ),
+            pytest.param(
+                "https://arxiv.org/html/1234.56789/figure1.jpg",
+                {
+                    "return_value": Response(
+                        200,
+                        content=_JPEG_BYTES,
+                        headers={"content-type": "image/jpeg; charset=utf-8"},
+                    )
+                },
+                (_JPEG_BYTES, "image/jpeg"),
+                id="jpeg-strips-charset",
+            ),
+            pytest.param(
+                "https://arxiv.org/html/1234.56789/missing.png",
+                {"return_value": Response(404)},
+                None,
+                id="not-found",
+            ),
+            pytest.param(
+                "https://arxiv.org/html/1234.56789/slow.png",
+                {"side_effect": httpx.TimeoutException("timeout")},
+                None,
+                id="timeout",
+            ),
+        ],
+    )
+    def test_download_image(
+        self, image_url: str, mock: dict, expected: tuple[bytes, str] | None
+    ) -> None:
+        """Test image download results, including failures returning None."""
+        respx.get(image_url).mock(**mock)
+
+        assert _download_image(image_url) == expected
+
+
+class TestImageMap:
+    """Tests for building the image data URI map."""
 
-        respx.get(image_url).mock(
+    @respx.mock
+    def test_shared_url_downloaded_once(self) -> None:
+        """Test that srcs resolving to the same URL trigger a single download."""
+        image_url = _FIGURE_URL
+        route = respx.get(image_url).mock(
             return_value=Response(
                 200,
-                content=image_content,
+                content=_PNG_BYTES,
                 headers={"content-type": "image/png"},
             )
         )
 
-        result = _download_image(image_url)
-        assert result is not None
-        data, media_type = result
-        assert data == image_content
-        assert media_type == "image/png"
+        image_map = _build_image_map({
+            "figure1.png": image_url,
+            "./figure1.png": image_url,
+        })
 
-    @respx.mock
-    def test_download_image_jpeg(self) -> None:
-        """Test downloading JPEG image."""
-        image_url = "https://arxiv.org/html/1234.56789/figure1.jpg"
-        image_content = b"\xff\xd8\xff fake jpeg"
+        assert route.call_count == 1
+        assert image_map["figure1.png"].startswith("data:image/png;base64,")
+        assert image_map["figure1.png"] == image_map["./figure1.png"] == image_map[image_url]
 
-        respx.get(image_url).mock(
-            return_value=Response(
-                200,
-                content=image_content,
-                headers={"content-type": "image/jpeg; charset=utf-8"},
+    @respx.mock
+    def test_many_images_all_mapped(self) -> None:
+        """Test that concurrent downloads keep each result with its own URL."""
+        urls = [f"https://arxiv.org/html/1234.56789/x{i}.png" for i in range(20)]
+        for i, url in enumerate(urls):
+            respx.get(url).mock(
+                return_value=Response(
+                    200,
+                    content=f"image {i}".encode(),
+                    headers={"content-type": "image/png"},
+                )
             )
-        )
 
-        result = _download_image(image_url)
-        assert result is not None
-        _, media_type = result
-        assert media_type == "image/jpeg"
+        image_map = _build_image_map({f"x{i}.png": url for i, url in enumerate(urls)})
+
+        for i in range(20):
+            expected = base64.b64encode(f"image {i}".encode()).decode("ascii")
+            assert image_map[f"x{i}.png"] == f"data:image/png;base64,{expected}"
 
     @respx.mock
-    def test_download_image_failure(self) -> None:
-        """Test failed image download returns None."""
+    def test_failed_download_not_mapped(self) -> None:
+        """Test that images that fail to download are left out of the map."""
         image_url = "https://arxiv.org/html/1234.56789/missing.png"
-
         respx.get(image_url).mock(return_value=Response(404))
 
-        result = _download_image(image_url)
-        assert result is None
-
-    @respx.mock
-    def test_download_image_timeout(self) -> None:
-        """Test image download timeout returns None."""
-        import httpx
-
-        image_url = "https://arxiv.org/html/1234.56789/slow.png"
-
-        respx.get(image_url).mock(side_effect=httpx.TimeoutException("timeout"))
-
-        result = _download_image(image_url)
-        assert result is None
+        assert _build_image_map({"missing.png": image_url}) == {}
 
 
 class TestConverterWithImages:
     """Tests for converter with image handling."""
 
-    @respx.mock
-    def test_convert_with_images(self) -> None:
+    def test_convert_with_images(
+        self, tmp_path: Path, image_registry: dict[str, tuple[bytes, str]]
+    ) -> None:
         """Test conversion with image downloading."""
         image_url = "https://arxiv.org/html/test/figure1.png"
-        image_content = b"\x89PNG\r\n\x1a\n fake png"
-
-        respx.get(image_url).mock(
-            return_value=Response(
-                200,
-                content=image_content,
-                headers={"content-type": "image/png"},
-            )
-        )
+        image_registry[image_url] = (_PNG_BYTES, "image/png")
 
         paper = Paper(
             id="test.00001",
@@ -119,21 +173,19 @@ class TestConverterWithImages:
             all_images={image_url: image_url},
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=True)
+        output_path = tmp_path / "test.pdf"
+        result = convert_to_pdf(paper, output_path, download_images=True)
 
-            assert result.exists()
-            # PDF with images should be larger
-            assert result.stat().st_size > 1000
+        assert result.exists()
+        # PDF with images should be larger
+        assert result.stat().st_size > 1000
 
-    @respx.mock
-    def test_convert_with_missing_images(self) -> None:
+    @pytest.mark.usefixtures("image_registry")
+    def test_convert_with_missing_images(self, tmp_path: Path) -> None:
         """Test conversion continues when images fail to download."""
+        # Nothing registered, so every download fails
         image_url = "https://arxiv.org/html/test/missing.png"
 
-        respx.get(image_url).mock(return_value=Response(404))
-
         paper = Paper(
             id="test.00001",
             title="Test Paper",
@@ -150,137 +202,103 @@ class TestConverterWithImages:
             all_images={image_url: image_url},
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            # Should not raise, just skip the image
-            result = convert_to_pdf(paper, output_path, download_images=True)
-            assert result.exists()
+        output_path = tmp_path / "test.pdf"
+        # Should not raise, just skip the image
+        result = convert_to_pdf(paper, output_path, download_images=True)
+        assert result.exists()
+
+
+_BASE_PAPER = Paper(
+    id="test.00001",
+    title="Paper",
+    authors=["Author"],
+    abstract="Abstract",
+    sections=[],
+)
+
+
+def make_paper(**overrides) -> Paper:
+    """Return a copy of the minimal base paper with the given fields replaced."""
+    return dataclasses.replace(_BASE_PAPER, **overrides)
 
 
 class TestConverterEdgeCases:
     """Edge case tests for the converter."""
 
-    def test_convert_paper_without_abstract(self) -> None:
+    def test_convert_paper_without_abstract(self, tmp_path: Path) -> None:
         """Test converting paper with no abstract."""
-        paper = Paper(
-            id="test.00001",
+        paper = make_paper(
             title="Paper Without Abstract",
-            authors=["Author"],
             abstract="",  # Empty abstract
-            sections=[
-                Section(id="S1", title="Content", level=1, content="<p>Text</p>")
-            ],
+            sections=[Section(id="S1", title="Content", level=1, content="<p>Text</p>")],
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
-            assert result.exists()
+        output_path = tmp_path / "test.pdf"
+        result = convert_to_pdf(paper, output_path, download_images=False)
+        assert result.exists()
 
-    def test_convert_paper_without_sections(self) -> None:
+    def test_convert_paper_without_sections(self, tmp_path: Path) -> None:
         """Test converting paper with no sections."""
-        paper = Paper(
-            id="test.00001",
-            title="Paper Without Sections",
-            authors=["Author"],
-            abstract="Just an abstract",
-            sections=[],
-        )
+        paper = make_paper(title="Paper Without Sections", abstract="Just an abstract")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
-            assert result.exists()
+        output_path = tmp_path / "test.pdf"
+        result = convert_to_pdf(paper, output_path, download_images=False)
+        assert result.exists()
 
-    def test_convert_paper_without_references(self) -> None:
+    def test_convert_paper_without_references(self, tmp_path: Path) -> None:
         """Test converting paper with no references."""
-        paper = Paper(
-            id="test.00001",
-            title="Paper",
-            authors=["Author"],
-            abstract="Abstract",
-            sections=[],
-            references_html=None,
-        )
+        paper = make_paper(references_html=None)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
-            assert result.exists()
+        output_path = tmp_path / "test.pdf"
+        result = convert_to_pdf(paper, output_path, download_images=False)
+        assert result.exists()
 
-    def test_convert_paper_without_date(self) -> None:
+    def test_convert_paper_without_date(self, tmp_path: Path) -> None:
         """Test converting paper with no date."""
-        paper = Paper(
-            id="test.00001",
-            title="Paper",
-            authors=["Author"],
-            abstract="Abstract",
-            date=None,
-            sections=[],
-        )
+        paper = make_paper(date=None)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
-            assert result.exists()
+        output_path = tmp_path / "test.pdf"
+        result = convert_to_pdf(paper, output_path, download_images=False)
+        assert result.exists()
 
-    def test_convert_paper_with_old_format_id(self) -> None:
+    def test_convert_paper_with_old_format_id(self, tmp_path: Path) -> None:
         """Test converting paper with old-format arXiv ID."""
-        paper = Paper(
-            id="hep-th/9901001",
-            title="Old Format Paper",
-            authors=["Author"],
-            abstract="Abstract",
-            sections=[],
-        )
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            import os
+        paper = make_paper(id="hep-th/9901001", title="Old Format Paper")
 
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir)
-                result = convert_to_pdf(paper, download_images=False)
-                assert result.exists()
-                # Filename should have slash replaced
-                assert "hep-th_9901001" in result.name
-            finally:
-                os.chdir(original_cwd)
+        result = convert_to_pdf(paper, download_images=False, output_dir=tmp_path)
+        assert result.exists()
+        # Filename should have slash replaced
+        assert "hep-th_9901001" in result.name
 
 
+@pytest.mark.math
 class TestMathMLRendering:
     """Tests for native MathML rendering via Playwright."""
 
-    def test_pdf_with_inline_math(self) -> None:
-        """Test PDF conversion with inline MathML."""
-        paper = Paper(
-            id="test.00001",
-            title="Math Paper",
-            authors=["Author"],
-            abstract="A paper about math",
-            sections=[
-                Section(
-                    id="S1",
-                    title="Introduction",
-                    level=1,
-                    content='<p>Consider <math alttext="x"><mi>x</mi></math> in text.</p>',
-                )
-            ],
-        )
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "math_test.pdf"
-            result = convert_to_pdf(
-                paper,
-                output_path,
-                download_images=False,
-            )
-
-            assert result.exists()
-            assert result.stat().st_size > 1000
-
-    def test_pdf_with_display_math(self) -> None:
-        """Test PDF conversion with display (block) MathML."""
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param(
+                '<p>Consider <math alttext="x"><mi>x</mi></math> in text.</p>',
+                id="inline",
+            ),
+            pytest.param(
+                '<div><math alttext="\\alpha + \\beta" display="block">'
+                "<mi>α</mi><mo>+</mo><mi>β</mi></math></div>",
+                id="display",
+            ),
+            pytest.param(
+                '''<p>The equation <math display="block">
+                    <mrow>
+                        <mi>E</mi><mo>=</mo><mi>m</mi><msup><mi>c</mi><mn>2</mn></msup>
+                    </mrow>
+                </math> is famous.</p>''',
+                id="complex",
+            ),
+        ],
+    )
+    def test_pdf_with_math(self, tmp_path: Path, content: str) -> None:
+        """Test PDF conversion with inline, display and nested MathML."""
         paper = Paper(
             id="test.00001",
             title="Math Paper",
@@ -291,59 +309,26 @@ class TestMathMLRendering:
                     id="S1",
                     title="Introduction",
                     level=1,
-                    content='<div><math alttext="\\alpha + \\beta" display="block"><mi>α</mi><mo>+</mo><mi>β</mi></math></div>',
+                    content=content,
                 )
             ],
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "math_test.pdf"
-            result = convert_to_pdf(
-                paper,
-                output_path,
-                download_images=False,
-            )
-
-            assert result.exists()
-            assert result.stat().st_size > 1000
-
-    def test_pdf_with_complex_math(self) -> None:
-        """Test PDF conversion with complex MathML expressions."""
-        paper = Paper(
-            id="test.00001",
-            title="Complex Math Paper",
-            authors=["Author"],
-            abstract="A paper with complex math",
-            sections=[
-                Section(
-                    id="S1",
-                    title="Equations",
-                    level=1,
-                    content='''<p>The equation <math display="block">
-                        <mrow>
-                            <mi>E</mi><mo>=</mo><mi>m</mi><msup><mi>c</mi><mn>2</mn></msup>
-                        </mrow>
-                    </math> is famous.</p>''',
-                )
-            ],
+        output_path = tmp_path / "math_test.pdf"
+        result = convert_to_pdf(
+            paper,
+            output_path,
+            download_images=False,
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "complex_math.pdf"
-            result = convert_to_pdf(
-                paper,
-                output_path,
-                download_images=False,
-            )
-
-            assert result.exists()
-            assert result.stat().st_size > 1000
+        assert result.exists()
+        assert result.stat().st_size > 1000
 
 
 class TestFootnotesConversion:
     """Tests for footnotes in converter."""
 
-    def test_pdf_with_footnotes(self) -> None:
+    def test_pdf_with_footnotes(self, tmp_path: Path) -> None:
         """Test PDF generation with footnotes."""
         paper = Paper(
             id="test.00001",
@@ -363,9 +348,8 @@ class TestFootnotesConversion:
             ],
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "footnotes_test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
+        output_path = tmp_path / "footnotes_test.pdf"
+        result = convert_to_pdf(paper, output_path, download_images=False)
 
-            assert result.exists()
-            assert result.stat().st_size > 1000
+        assert result.exists()
+        assert result.stat().st_size > 1000
@@ -8,6 +8,8 @@ from arxiv_to_ereader.fetcher import (
     normalize_arxiv_id,
 )
 
+pytestmark = pytest.mark.filterwarnings("error")
+
 
 class TestNormalizeArxivId:
     """Tests for normalize_arxiv_id function."""
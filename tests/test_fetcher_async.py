@@ -10,6 +10,9 @@ from arxiv_to_ereader.fetcher import (
     fetch_papers_batch,
 )
 
+# Catch httpx and pytest-asyncio deprecations as soon as they appear
+pytestmark = pytest.mark.filterwarnings("error")
+
 
 class TestAsyncFetcher:
     """Tests for async fetcher functions."""
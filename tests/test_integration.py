@@ -1,6 +1,6 @@
 """Integration tests for end-to-end conversion."""
 
-import tempfile
+import io
 from pathlib import Path
 
 import pytest
@@ -8,8 +8,8 @@ import respx
 from httpx import Response
 
 from arxiv_to_ereader import convert_to_pdf, fetch_paper, parse_paper
-from arxiv_to_ereader.parser import Section
 from arxiv_to_ereader.fetcher import ArxivFetchError, ArxivHTMLNotAvailable
+from arxiv_to_ereader.parser import Paper, Section
 
 # Realistic arXiv HTML sample
 REALISTIC_ARXIV_HTML = """
@@ -102,7 +102,7 @@ class TestEndToEndConversion:
     """End-to-end integration tests."""
 
     @respx.mock
-    def test_fetch_parse_convert_pipeline(self) -> None:
+    def test_fetch_parse_convert_pipeline(self, tmp_path: Path) -> None:
         """Test the complete fetch -> parse -> convert pipeline."""
         paper_id = "1706.03762"
         respx.get(f"https://arxiv.org/html/{paper_id}").mock(
@@ -122,15 +122,14 @@ class TestEndToEndConversion:
         assert len(paper.sections) >= 4
 
         # Convert
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "transformer.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
+        output_path = tmp_path / "transformer.pdf"
+        result = convert_to_pdf(paper, output_path, download_images=False)
 
-            assert result.exists()
-            # Check it's a valid PDF
-            with open(result, "rb") as f:
-                header = f.read(8)
-            assert header.startswith(b"%PDF-")
+        assert result.exists()
+        # Check it's a valid PDF
+        with open(result, "rb") as f:
+            header = f.read(8)
+        assert header.startswith(b"%PDF-")
 
     @respx.mock
     def test_fetch_404_raises_not_available(self) -> None:
@@ -155,7 +154,7 @@ class TestEndToEndConversion:
             fetch_paper(paper_id)
 
     @respx.mock
-    def test_batch_conversion(self) -> None:
+    def test_batch_conversion(self, tmp_path: Path) -> None:
         """Test converting multiple papers."""
         papers = ["1706.03762", "1234.56789"]
 
@@ -164,13 +163,12 @@ class TestEndToEndConversion:
                 return_value=Response(200, text=REALISTIC_ARXIV_HTML)
             )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            for paper_id in papers:
-                _, html = fetch_paper(paper_id)
-                paper = parse_paper(html, paper_id)
-                output_path = Path(tmpdir) / f"{paper_id}.pdf"
-                result = convert_to_pdf(paper, output_path, download_images=False)
-                assert result.exists()
+        for paper_id in papers:
+            _, html = fetch_paper(paper_id)
+            paper = parse_paper(html, paper_id)
+            output_path = tmp_path / f"{paper_id}.pdf"
+            result = convert_to_pdf(paper, output_path, download_images=False)
+            assert result.exists()
 
 
 class TestUnicodeHandling:
@@ -205,10 +203,8 @@ class TestUnicodeHandling:
         paper = parse_paper(html, "0000.00000")
         assert "Jose Garcia" in paper.authors
 
-    def test_unicode_pdf_generation(self) -> None:
+    def test_unicode_pdf_generation(self, tmp_path: Path) -> None:
         """Test that Unicode content survives PDF generation."""
-        from arxiv_to_ereader.parser import Paper, Section
-
         paper = Paper(
             id="0000.00000",
             title="Equations differentielles avec alpha et beta",
@@ -224,14 +220,13 @@ class TestUnicodeHandling:
             ],
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "unicode.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
-            assert result.exists()
-            # PDF should be valid
-            with open(result, "rb") as f:
-                header = f.read(8)
-            assert header.startswith(b"%PDF-")
+        output_path = tmp_path / "unicode.pdf"
+        result = convert_to_pdf(paper, output_path, download_images=False)
+        assert result.exists()
+        # PDF should be valid
+        with open(result, "rb") as f:
+            header = f.read(8)
+        assert header.startswith(b"%PDF-")
 
 
 class TestMalformedHTML:
@@ -302,64 +297,14 @@ class TestMalformedHTML:
 class TestPdfValidity:
     """Tests for PDF structural validity."""
 
-    def test_pdf_has_valid_header(self) -> None:
-        """Test that PDF has valid header."""
-        from arxiv_to_ereader.parser import Paper
-
-        paper = Paper(
-            id="test.00001",
-            title="Test",
-            authors=["Author"],
-            abstract="Abstract",
-            sections=[],
-        )
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
-
-            with open(result, "rb") as f:
-                header = f.read(8)
-            assert header.startswith(b"%PDF-")
-
-    def test_pdf_has_eof_marker(self) -> None:
-        """Test that PDF has EOF marker."""
-        from arxiv_to_ereader.parser import Paper
-
-        paper = Paper(
-            id="test.00001",
-            title="Test",
-            authors=["Author"],
-            abstract="Abstract",
-            sections=[],
-        )
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
+    def test_pdf_header_and_eof_marker(self, reference_pdf_bytes: bytes) -> None:
+        """Test that PDF has a valid header and EOF marker."""
+        assert reference_pdf_bytes.startswith(b"%PDF-")
+        assert b"%%EOF" in reference_pdf_bytes[-100:]
 
-            with open(result, "rb") as f:
-                f.seek(-100, 2)  # Read last 100 bytes
-                tail = f.read()
-            assert b"%%EOF" in tail
-
-    def test_pdf_with_pypdf(self) -> None:
+    def test_pdf_with_pypdf(self, reference_pdf_bytes: bytes) -> None:
         """Test that PDF can be parsed by pypdf."""
         pypdf = pytest.importorskip("pypdf")
-        from pypdf import PdfReader
-        from arxiv_to_ereader.parser import Paper
-
-        paper = Paper(
-            id="test.00001",
-            title="Test Paper Title",
-            authors=["Author"],
-            abstract="Abstract",
-            sections=[],
-        )
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(paper, output_path, download_images=False)
 
-            reader = PdfReader(result)
-            assert len(reader.pages) > 0
+        reader = pypdf.PdfReader(io.BytesIO(reference_pdf_bytes))
+        assert len(reader.pages) > 0
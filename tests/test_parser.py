@@ -1,7 +1,13 @@
 """Tests for the parser module."""
 
+import pytest
+from bs4 import BeautifulSoup
+
 from arxiv_to_ereader.parser import parse_paper
 
+# Treat bs4/lxml deprecations as failures instead of letting them accumulate
+pytestmark = pytest.mark.filterwarnings("error")
+
 
 class TestParsePaper:
     """Tests for parse_paper function."""
@@ -147,3 +153,141 @@ class TestParserEdgeCases:
         paper = parse_paper(html, "0000.00000")
         # Should either have no sections or a main content section
         assert isinstance(paper.sections, list)
+
+    def test_math_annotations_stripped(self) -> None:
+        """Test that MathML annotations are dropped but the rendered math is kept."""
+        html = """
+        <html>
+        <body>
+            <section class="ltx_section" id="S1">
+                <h2 class="ltx_title">1 Math</h2>
+                <p>Inline <math alttext="x^{2}" display="inline"><semantics>
+                    <msup><mi>x</mi><mn>2</mn></msup>
+                    <annotation-xml encoding="MathML-Content">
+                        <apply><power/></apply>
+                    </annotation-xml>
+                    <annotation encoding="application/x-tex">x^{2}</annotation>
+                </semantics></math> math.</p>
+            </section>
+        </body>
+        </html>
+        """
+        paper = parse_paper(html, "0000.00000")
+        content = paper.sections[0].content
+        assert "<msup>" in content
+        assert 'alttext="x^{2}"' in content
+        assert "annotation" not in content
+
+    def test_styling_classes_added(self) -> None:
+        """Test that LaTeXML elements get their styling classes and refs are rewritten."""
+        html = """
+        <html>
+        <body>
+            <section class="ltx_section" id="S1">
+                <h2 class="ltx_title">1 Content</h2>
+                <div class="ltx_theorem ltx_proof">Theorem.</div>
+                <div class="ltx_listing">code</div>
+                <table class="ltx_equation"><tr><td>eq</td></tr></table>
+                <p><span class="ltx_Math">x</span>
+                <cite class="ltx_cite">[1]</cite>
+                <a class="ltx_ref" href="https://arxiv.org/html/0000.00000#S2">Sec 2</a></p>
+            </section>
+        </body>
+        </html>
+        """
+        paper = parse_paper(html, "0000.00000")
+        content = paper.sections[0].content
+        assert 'class="ltx_theorem ltx_proof theorem-like"' in content
+        assert 'class="ltx_listing code-block"' in content
+        assert 'class="ltx_equation math-block"' in content
+        assert 'class="ltx_Math math-inline"' in content
+        assert 'class="ltx_cite citation"' in content
+        assert 'href="#S2"' in content
+
+    def test_algorithm_svg_converted(self) -> None:
+        """Test that algorithm SVGs are replaced by an HTML algorithm block."""
+        html = """
+        <html>
+        <body>
+            <section class="ltx_section" id="S1">
+                <h2 class="ltx_title">1 Method</h2>
+                <figure class="ltx_figure" id="alg1">
+                    <svg class="ltx_picture" width="400" height="200">
+                        <g transform="matrix(1 0 0 -1 0 200)">
+                            <foreignobject width="400" height="20">
+                                <span class="ltx_foreignobject_content">Algorithm 1 Train</span>
+                            </foreignobject>
+                            <foreignobject width="400" height="20">
+                                <span class="ltx_foreignobject_content">1: init weights</span>
+                            </foreignobject>
+                            <foreignobject width="400" height="20">
+                                <span class="ltx_foreignobject_content">2: run SGD</span>
+                            </foreignobject>
+                        </g>
+                    </svg>
+                </figure>
+            </section>
+        </body>
+        </html>
+        """
+        paper = parse_paper(html, "0000.00000")
+        section = BeautifulSoup(paper.sections[0].content, "lxml")
+
+        assert section.find("figure") is None
+        assert section.find("svg") is None
+
+        block = section.select_one("div.algorithm-block")
+        assert block is not None
+        title = block.select_one("div.algorithm-title")
+        assert title is not None
+        assert title.get_text(strip=True) == "Algorithm 1 Train"
+        body = block.select_one("div.algorithm-body")
+        assert body is not None
+        steps = [s.get_text(strip=True) for s in body.select(".ltx_foreignobject_content")]
+        assert steps == ["1: init weights", "2: run SGD"]
+
+    def test_duplicate_authors_removed(self) -> None:
+        """Test that repeated author names are kept once, in first-seen order."""
+        names = [f"Author {i}" for i in range(50)]
+        personnames = "".join(
+            f'<span class="ltx_personname">{name}</span>' for name in names + names[::-1]
+        )
+        html = f"""
+        <html>
+        <body>
+            <div class="ltx_authors">{personnames}</div>
+        </body>
+        </html>
+        """
+        paper = parse_paper(html, "0000.00000")
+        assert paper.authors == names
+
+    def test_all_images_resolved(self) -> None:
+        """Test that image srcs map to absolute URLs, skipping data URIs and empty srcs."""
+        html = """
+        <html>
+        <body>
+            <p><img src="x1.png"/><img src="data:image/png;base64,AAAA"/></p>
+            <p><img src=""/><img alt="no src"/></p>
+        </body>
+        </html>
+        """
+        paper = parse_paper(html, "0000.00000")
+        assert paper.all_images == {"x1.png": "https://arxiv.org/html/0000.00000/x1.png"}
+
+    def test_footnote_text_stays_escaped(self) -> None:
+        """Test that escaped characters in footnotes are not turned back into markup."""
+        html = """
+        <html>
+        <body>
+            <section class="ltx_section" id="S1">
+                <h2 class="ltx_title">1 Notes</h2>
+                <p>Text<span class="ltx_note">
+                    <span class="ltx_note_content">a &lt;b&gt; &amp; c</span>
+                </span></p>
+            </section>
+        </body>
+        </html>
+        """
+        paper = parse_paper(html, "0000.00000")
+        assert paper.footnotes[0].content == "a &lt;b&gt; &amp; c"
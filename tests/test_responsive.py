@@ -1,13 +1,13 @@
 """Tests for PDF styling and screen presets."""
 
-import tempfile
+import io
 from pathlib import Path
 
 import pytest
 
 from arxiv_to_ereader.converter import convert_to_pdf
 from arxiv_to_ereader.parser import Paper, Section
-from arxiv_to_ereader.screen_presets import SCREEN_PRESETS, get_preset
+from arxiv_to_ereader.screen_presets import SCREEN_PRESETS, custom_preset, get_preset
 from arxiv_to_ereader.styles import get_pdf_stylesheet
 
 
@@ -45,6 +45,27 @@ class TestPdfStylesheet:
         assert f"{paperwhite.base_font_pt}pt" in css_pw
         assert scribe.base_font_pt >= paperwhite.base_font_pt
 
+    def test_font_sizes_scale_from_base_font(self) -> None:
+        """Test that only the base font varies and other sizes are derived in CSS."""
+        scribe = get_pdf_stylesheet(get_preset("kindle-scribe"))
+        custom = get_pdf_stylesheet(custom_preset(100, 150, base_font_pt=9))
+        assert scribe.startswith(":root{--base-font:12pt}")
+        assert "calc(var(--base-font) * 1.5)" in scribe
+        assert scribe.split("}", 1)[1] == custom.split("}", 1)[1]
+
+    def test_stylesheet_minified(self) -> None:
+        """Test that comments and layout whitespace are stripped from the stylesheet."""
+        css = get_pdf_stylesheet(get_preset("kindle-paperwhite"))
+        assert "/*" not in css
+        assert "\n" not in css
+        assert 'font-family:Georgia,"Times New Roman",serif' in css
+
+    def test_stylesheet_shared_by_font_size(self) -> None:
+        """Test that presets with the same base font reuse one cached stylesheet."""
+        paperwhite = get_preset("kindle-paperwhite")
+        custom = custom_preset(120, 160, base_font_pt=paperwhite.base_font_pt)
+        assert get_pdf_stylesheet(custom) is get_pdf_stylesheet(paperwhite)
+
 
 class TestScreenPresets:
     """Tests for screen preset configurations."""
@@ -101,30 +122,29 @@ class TestPdfGeneration:
             ],
         )
 
-    def test_pdf_with_default_preset(self, sample_paper: Paper) -> None:
-        """Test PDF generation with default preset."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.pdf"
-            result = convert_to_pdf(sample_paper, output_path, download_images=False)
-
-            assert result.exists()
-            # Check it's a valid PDF
-            with open(result, "rb") as f:
-                header = f.read(8)
-            assert header.startswith(b"%PDF-")
+    def test_pdf_with_default_preset(self, reference_pdf_bytes: bytes) -> None:
+        """Test that the default preset sets the Kindle Paperwhite page size."""
+        pypdf = pytest.importorskip("pypdf")
 
-    def test_pdf_with_all_presets(self, sample_paper: Paper) -> None:
+        preset = get_preset("kindle-paperwhite")
+        page = pypdf.PdfReader(io.BytesIO(reference_pdf_bytes)).pages[0]
+        # PDF user space is in points (1/72 inch)
+        assert float(page.mediabox.width) == pytest.approx(preset.width_mm / 25.4 * 72, abs=1)
+        assert float(page.mediabox.height) == pytest.approx(preset.height_mm / 25.4 * 72, abs=1)
+
+    @pytest.mark.parametrize("preset_name", list(SCREEN_PRESETS))
+    def test_pdf_with_all_presets(
+        self, sample_paper: Paper, tmp_path: Path, preset_name: str
+    ) -> None:
         """Test PDF generation with all available presets."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            for preset_name in SCREEN_PRESETS:
-                output_path = Path(tmpdir) / f"test_{preset_name}.pdf"
-                result = convert_to_pdf(
-                    sample_paper,
-                    output_path,
-                    screen_preset=preset_name,
-                    download_images=False,
-                )
-                assert result.exists()
+        output_path = tmp_path / f"test_{preset_name}.pdf"
+        result = convert_to_pdf(
+            sample_paper,
+            output_path,
+            screen_preset=preset_name,
+            download_images=False,
+        )
+        assert result.exists()
 
 
 class TestTextHandling:
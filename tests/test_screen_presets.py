@@ -9,6 +9,8 @@ from arxiv_to_ereader.screen_presets import (
     get_preset,
 )
 
+pytestmark = pytest.mark.filterwarnings("error")
+
 
 class TestScreenPresets:
     """Tests for screen presets."""